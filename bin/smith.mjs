@@ -4,6 +4,7 @@ import { readFileSync } from 'node:fs';
 import { setTimeout as delay } from 'node:timers/promises';
 import { fileURLToPath } from 'node:url';
 import path from 'node:path';
+import { performance } from 'node:perf_hooks';
 import process from 'node:process';
 
 import {
@@ -28,6 +29,7 @@ const HEALTH_CHECK_TIMEOUT_MS = 15000;
 const HEALTH_CHECK_INTERVAL_MS = 500;
 const CODEX_FALLBACK_MODEL = 'gpt-5-codex';
 const CODEX_PROVIDER_KEY = 'openai-responses';
+const CODEX_PROVIDER_CONFIG_KEY = `model_providers.${CODEX_PROVIDER_KEY}`;
 const BIFROST_HEALTH_PATH = '/healthz';
 const CLICKHOUSE_SCHEMA_PATH = '/docker-entrypoint-initdb.d/00-init.sql';
 
@@ -135,9 +137,9 @@ function buildComposeEnvironment() {
 }
 
 async function waitForCollector() {
-  const deadline = Date.now() + HEALTH_CHECK_TIMEOUT_MS;
+  const deadline = performance.now() + HEALTH_CHECK_TIMEOUT_MS;
 
-  while (Date.now() < deadline) {
+  while (performance.now() < deadline) {
     try {
       const controller = new AbortController();
       const timeout = setTimeout(() => controller.abort(), 2000);
@@ -201,9 +203,9 @@ async function waitForBifrost(rawGatewayUrl) {
     healthUrl = `${DEFAULT_BIFROST_URL}${BIFROST_HEALTH_PATH}`;
   }
 
-  const deadline = Date.now() + HEALTH_CHECK_TIMEOUT_MS;
+  const deadline = performance.now() + HEALTH_CHECK_TIMEOUT_MS;
 
-  while (Date.now() < deadline) {
+  while (performance.now() < deadline) {
     try {
       const controller = new AbortController();
       const timeout = setTimeout(() => controller.abort(), 2000);
@@ -270,7 +272,7 @@ async function buildAgentConfiguration(agentName) {
   }
   resourceAttributes['smith.agent.name'] = agentName;
 
-  const gitMetadata = detectGitMetadata();
+  const gitMetadata = await detectGitMetadata();
   Object.assign(resourceAttributes, gitMetadata);
 
   if (env.SMITH_OBSERVABILITY_KEEP_OTEL === '1') {
@@ -408,14 +410,11 @@ function serialiseResourceAttributes(map) {
     .join(',');
 }
 
-function detectGitMetadata() {
+async function detectGitMetadata() {
   const metadata = {};
   const cwd = process.cwd();
 
-  const topLevel = spawnSync('git', ['rev-parse', '--show-toplevel'], {
-    cwd,
-    encoding: 'utf8'
-  });
+  const topLevel = await runGit(['rev-parse', '--show-toplevel'], cwd);
   if (topLevel.status !== 0) {
     return metadata;
   }
@@ -425,10 +424,13 @@ function detectGitMetadata() {
 
   metadata['smith.git.root'] = escapeAttributeValue(root);
 
-  const remote = spawnSync('git', ['config', '--get', 'remote.origin.url'], {
-    cwd,
-    encoding: 'utf8'
-  });
+  // The remaining lookups are independent, so run them concurrently.
+  const [remote, branch, dirty] = await Promise.all([
+    runGit(['config', '--get', 'remote.origin.url'], cwd),
+    runGit(['rev-parse', '--abbrev-ref', 'HEAD'], cwd),
+    isGitDirty(cwd)
+  ]);
+
   if (remote.status === 0) {
     const repoUrl = remote.stdout.trim();
     if (repoUrl) {
@@ -436,10 +438,6 @@ function detectGitMetadata() {
     }
   }
 
-  const branch = spawnSync('git', ['rev-parse', '--abbrev-ref', 'HEAD'], {
-    cwd,
-    encoding: 'utf8'
-  });
   if (branch.status === 0) {
     const name = branch.stdout.trim();
     if (name) {
@@ -447,7 +445,7 @@ function detectGitMetadata() {
     }
   }
 
-  metadata['smith.git.status_dirty'] = isGitDirty(cwd) ? 'true' : 'false';
+  metadata['smith.git.status_dirty'] = dirty ? 'true' : 'false';
 
   return metadata;
 }
@@ -456,17 +454,32 @@ function escapeAttributeValue(value) {
   return value.replace(/,/g, '\\,');
 }
 
-function isGitDirty(cwd) {
-  const status = spawnSync('git', ['status', '--porcelain'], {
-    cwd,
-    encoding: 'utf8'
-  });
+async function isGitDirty(cwd) {
+  const status = await runGit(['status', '--porcelain'], cwd);
   if (status.status !== 0) {
     return false;
   }
   return status.stdout.trim().length > 0;
 }
 
+function runGit(args, cwd) {
+  return new Promise(resolve => {
+    const child = spawn('git', args, {
+      cwd,
+      stdio: ['ignore', 'pipe', 'ignore']
+    });
+
+    let stdout = '';
+    child.stdout.setEncoding('utf8');
+    child.stdout.on('data', chunk => {
+      stdout += chunk;
+    });
+
+    child.on('error', () => resolve({ status: null, stdout: '' }));
+    child.on('close', code => resolve({ status: code, stdout }));
+  });
+}
+
 function configureAgent(agentName, args, env) {
   const normalized = agentName.toLowerCase();
   if (normalized === 'codex') {
@@ -534,8 +547,7 @@ function configureClaudeAgent(originalArgs, env) {
   };
 }
 
-function transformCodexArgs(originalArgs, openAiBaseUrl) {
-  const args = [...originalArgs];
+function transformCodexArgs(args, openAiBaseUrl) {
   let hasModelArgument = false;
   let hasModelProviderOverride = false;
   let hasProviderConfigOverride = false;
@@ -587,7 +599,7 @@ function transformCodexArgs(originalArgs, openAiBaseUrl) {
       if (next.includes('model_provider=')) {
         hasModelProviderOverride = true;
       }
-      if (next.includes(`model_providers.${CODEX_PROVIDER_KEY}`)) {
+      if (next.includes(CODEX_PROVIDER_CONFIG_KEY)) {
         hasProviderConfigOverride = true;
       }
       result.push(arg);
@@ -598,7 +610,7 @@ function transformCodexArgs(originalArgs, openAiBaseUrl) {
       if (arg.includes('model_provider=')) {
         hasModelProviderOverride = true;
       }
-      if (arg.includes(`model_providers.${CODEX_PROVIDER_KEY}`)) {
+      if (arg.includes(CODEX_PROVIDER_CONFIG_KEY)) {
         hasProviderConfigOverride = true;
       }
       result.push(arg);
@@ -608,7 +620,7 @@ function transformCodexArgs(originalArgs, openAiBaseUrl) {
     if (arg.includes('model_provider=')) {
       hasModelProviderOverride = true;
     }
-    if (arg.includes(`model_providers.${CODEX_PROVIDER_KEY}`)) {
+    if (arg.includes(CODEX_PROVIDER_CONFIG_KEY)) {
       hasProviderConfigOverride = true;
     }
 
@@ -628,7 +640,7 @@ function transformCodexArgs(originalArgs, openAiBaseUrl) {
     result.push('--config', `model_provider="${CODEX_PROVIDER_KEY}"`);
   }
   if (!hasProviderConfigOverride) {
-    const providerConfig = `model_providers.${CODEX_PROVIDER_KEY}={name="OpenAI Responses",base_url="${openAiBaseUrl}",env_key="OPENAI_API_KEY",wire_api="responses"}`;
+    const providerConfig = `${CODEX_PROVIDER_CONFIG_KEY}={name="OpenAI Responses",base_url="${openAiBaseUrl}",env_key="OPENAI_API_KEY",wire_api="responses"}`;
     result.push('--config', providerConfig);
   }
 